@@ -1,9 +1,12 @@
 import streamlit as st
 import os
 import json
+import hmac
 from datetime import datetime
 from components.uploader import load_and_split, summarise_doc_excerpt, store_embeddings
+from components.transcript import list_sessions, load_transcript
 from config import settings
+from config.settings import settings as app_settings
 
 def render_sidebar():
     st.sidebar.title("📎 Upload to DT")
@@ -12,6 +15,29 @@ def render_sidebar():
     )
     return uploaded_files
 
+def render_session_picker(current_session_id):
+    st.sidebar.markdown("---")
+    st.sidebar.subheader("🗂️ Previous Sessions")
+
+    # Transcripts are not scoped per user, so restoring is limited to whoever holds the admin password
+    if not app_settings.DT_ADMIN_PASSWORD:
+        st.sidebar.caption("Session restore is disabled (set DT_ADMIN_PASSWORD to enable).")
+        return None
+    password = st.sidebar.text_input("Admin password", type="password", key="session_restore_password")
+    if not hmac.compare_digest(password, app_settings.DT_ADMIN_PASSWORD):
+        return None
+
+    sessions = [s for s in list_sessions() if s != current_session_id]
+    if not sessions:
+        st.sidebar.caption("No saved sessions yet.")
+        return None
+
+    st.sidebar.caption(f"{len(sessions)} saved session(s), most recent first.")
+    selected = st.sidebar.selectbox("Restore a conversation", sessions)
+    if st.sidebar.button("↩️ Restore session"):
+        return selected, load_transcript(selected)
+    return None
+
 def handle_file_uploads(uploaded_files):
     summaries = []
     last_uploaded = None
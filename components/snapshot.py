@@ -0,0 +1,298 @@
+# snapshot.py
+
+import io
+import os
+import json
+import zipfile
+import hashlib
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from pinecone import Pinecone as PineconeClient
+from config.settings import settings
+
+SNAPSHOT_VERSION = 1
+QUANTISE_MODES = (None, "float16", "int8")
+MAX_UPSERT_BYTES = 1_500_000  # headroom under Pinecone's 2 MB upsert request limit
+
+
+def get_index(index_name=None):
+    pc = PineconeClient(api_key=settings.PINECONE_API_KEY)
+    return pc.Index(index_name or settings.PINECONE_INDEX_NAME)
+
+
+def list_namespaces(index_name=None):
+    """
+    Lists the namespaces currently holding vectors in an index ("" is the default namespace).
+
+    :param index_name: Index to inspect (default: settings.PINECONE_INDEX_NAME)
+    :return: Sorted list of namespace names
+    """
+    return sorted(get_index(index_name).describe_index_stats()["namespaces"].keys())
+
+
+def _is_list_unsupported(error):
+    # Pod-based indexes reject list with a 400 rather than lacking the method
+    message = str(error).lower()
+    return getattr(error, "status", None) == 400 and ("not supported" in message or "pod" in message)
+
+
+def _iter_id_batches(index, namespace, batch_size):
+    """
+    Yields batches of vector IDs in a namespace.
+
+    Uses the paginated list endpoint (serverless indexes); if that is unavailable, falls back to
+    the dummy zero-vector query used by the memory viewer (capped at 10,000 IDs).
+    """
+    if hasattr(index, "list"):
+        pages = index.list(namespace=namespace, limit=batch_size)
+        try:
+            first = next(pages, None)
+        except Exception as e:
+            if not _is_list_unsupported(e):
+                raise
+            pages = None
+
+        if pages is not None:
+            if first:
+                yield list(first)
+            for ids in pages:
+                yield list(ids)
+            return
+
+    dimension = index.describe_index_stats()["dimension"]
+    response = index.query(vector=[0.0] * dimension, top_k=10000, namespace=namespace, include_values=False)
+    ids = [match["id"] for match in response.get("matches", [])]
+    for i in range(0, len(ids), batch_size):
+        yield ids[i:i + batch_size]
+
+
+def _namespace_stats(index, namespace):
+    stats = index.describe_index_stats()
+    return stats["dimension"], stats["namespaces"].get(namespace, {}).get("vector_count", 0)
+
+
+def _encode_vectors(values, quantise):
+    vectors = np.asarray(values, dtype=np.float32)
+    if quantise == "float16":
+        return vectors.astype(np.float16), None
+    if quantise == "int8":
+        scales = np.abs(vectors).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        return np.round(vectors / scales[:, None]).astype(np.int8), scales.astype(np.float32)
+    return vectors, None
+
+
+def _decode_vectors(vectors, scales):
+    vectors = vectors.astype(np.float32)
+    if scales is not None:
+        vectors *= scales[:, None]
+    return vectors
+
+
+def _npy_bytes(array):
+    buf = io.BytesIO()
+    np.save(buf, array, allow_pickle=False)
+    return buf.getvalue()
+
+
+def _write_chunk(archive, chunk_no, ids, values, metadata, quantise):
+    vectors, scales = _encode_vectors(values, quantise)
+    members = {
+        "ids.json": json.dumps(ids).encode("utf-8"),
+        "vectors.npy": _npy_bytes(vectors),
+        "metadata.jsonl": "\n".join(json.dumps(m, ensure_ascii=False) for m in metadata).encode("utf-8"),
+    }
+    if scales is not None:
+        members["scales.npy"] = _npy_bytes(scales)
+
+    prefix = f"chunk-{chunk_no:05d}/"
+    checksums = {}
+    for name, data in members.items():
+        archive.writestr(prefix + name, data)
+        checksums[name] = hashlib.sha256(data).hexdigest()
+    return {"name": prefix, "count": len(ids), "sha256": checksums}
+
+
+def export_namespace(path, namespace, index_name=None, quantise=None, chunk_size=1000, fetch_batch_size=100):
+    """
+    Streams every vector in a namespace (IDs, values, metadata) into a compact snapshot file.
+    Raises ValueError if fewer vectors were exported than the index reports for the namespace.
+
+    The snapshot is a zip archive of fixed-size chunks, each holding an ID list, a NumPy vector
+    matrix (optionally float16/int8 quantised) and JSONL metadata, plus a manifest with SHA-256
+    checksums per chunk member. No embedding calls are made.
+
+    :param path: Destination file path (or writable binary file object)
+    :param namespace: Pinecone namespace to export ("" for default)
+    :param index_name: Index to read from (default: settings.PINECONE_INDEX_NAME)
+    :param quantise: None (float32), "float16" or "int8"
+    :param chunk_size: Vectors per chunk in the snapshot
+    :param fetch_batch_size: IDs per fetch request
+    :return: Manifest dictionary
+    """
+    if quantise not in QUANTISE_MODES:
+        raise ValueError(f"Unsupported quantise mode: {quantise}")
+
+    index = get_index(index_name)
+    _, expected = _namespace_stats(index, namespace)
+    manifest = {
+        "version": SNAPSHOT_VERSION,
+        "index": index_name or settings.PINECONE_INDEX_NAME,
+        "namespace": namespace,
+        "quantise": quantise,
+        "created_at": datetime.now().isoformat(),
+        "dimension": None,
+        "count": 0,
+        "chunks": [],
+    }
+
+    if not isinstance(path, (str, os.PathLike)):
+        return _write_snapshot(path, index, namespace, manifest, expected, quantise, chunk_size, fetch_batch_size)
+
+    # Write beside the destination and rename on success so a failed export leaves no partial file
+    tmp_path = f"{os.fspath(path)}.partial"
+    try:
+        _write_snapshot(tmp_path, index, namespace, manifest, expected, quantise, chunk_size, fetch_batch_size)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+    return manifest
+
+
+def _write_snapshot(target, index, namespace, manifest, expected, quantise, chunk_size, fetch_batch_size):
+    ids, values, metadata = [], [], []
+    with zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for id_batch in _iter_id_batches(index, namespace, fetch_batch_size):
+            if not id_batch:
+                continue
+            response = index.fetch(ids=id_batch, namespace=namespace)
+            for vec_id in id_batch:
+                vec = response.vectors.get(vec_id)
+                if vec is None:
+                    continue
+                ids.append(vec_id)
+                values.append(vec.values)
+                metadata.append(vec.metadata or {})
+
+            while len(ids) >= chunk_size:
+                chunk = _write_chunk(archive, len(manifest["chunks"]), ids[:chunk_size],
+                                     values[:chunk_size], metadata[:chunk_size], quantise)
+                manifest["chunks"].append(chunk)
+                manifest["count"] += chunk["count"]
+                manifest["dimension"] = len(values[0])
+                ids, values, metadata = ids[chunk_size:], values[chunk_size:], metadata[chunk_size:]
+
+        if ids:
+            chunk = _write_chunk(archive, len(manifest["chunks"]), ids, values, metadata, quantise)
+            manifest["chunks"].append(chunk)
+            manifest["count"] += chunk["count"]
+            manifest["dimension"] = len(values[0])
+
+        if manifest["count"] < expected:
+            raise ValueError(
+                f"Snapshot incomplete: exported {manifest['count']} of {expected} vectors in '{namespace}'"
+            )
+
+        archive.writestr("manifest.json", json.dumps(manifest, indent=2))
+
+    return manifest
+
+
+def read_manifest(path):
+    with zipfile.ZipFile(path, "r") as archive:
+        return json.loads(archive.read("manifest.json"))
+
+
+def iter_snapshot(path, verify=True):
+    """
+    Yields (ids, vectors, metadata) per chunk from a snapshot file, dequantised to float32.
+    Usable on its own to pre-warm a local cache without touching Pinecone or OpenAI.
+
+    :param path: Snapshot file path (or readable binary file object)
+    :param verify: Check each chunk member against its manifest checksum
+    """
+    with zipfile.ZipFile(path, "r") as archive:
+        manifest = json.loads(archive.read("manifest.json"))
+        if manifest.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {manifest.get('version')}")
+
+        for chunk in manifest["chunks"]:
+            members = {name: archive.read(chunk["name"] + name) for name in chunk["sha256"]}
+            if verify:
+                for name, data in members.items():
+                    if hashlib.sha256(data).hexdigest() != chunk["sha256"][name]:
+                        raise ValueError(f"Checksum mismatch in {chunk['name']}{name}")
+
+            ids = json.loads(members["ids.json"])
+            vectors = np.load(io.BytesIO(members["vectors.npy"]), allow_pickle=False)
+            scales = None
+            if "scales.npy" in members:
+                scales = np.load(io.BytesIO(members["scales.npy"]), allow_pickle=False)
+            text = members["metadata.jsonl"].decode("utf-8")
+            metadata = [json.loads(line) for line in text.split("\n")] if text else []
+
+            yield ids, _decode_vectors(vectors, scales), metadata
+
+
+def _size_batches(records, max_records, max_bytes):
+    batch, size = [], 0
+    for record in records:
+        record_size = len(json.dumps(record))
+        if batch and (len(batch) >= max_records or size + record_size > max_bytes):
+            yield batch
+            batch, size = [], 0
+        batch.append(record)
+        size += record_size
+    if batch:
+        yield batch
+
+
+def import_snapshot(path, namespace=None, index_name=None, batch_size=100, max_workers=4, verify=True):
+    """
+    Bulk-loads a snapshot into a namespace using batched, parallel upserts.
+    Raises ValueError before any upsert if the target index dimension does not match the snapshot.
+
+    Batches are capped at batch_size records and MAX_UPSERT_BYTES of serialised payload. A failed
+    batch does not stop the restore; failures are counted and reported in the result.
+
+    :param path: Snapshot file path (or readable binary file object)
+    :param namespace: Target namespace (default: the namespace the snapshot was taken from)
+    :param index_name: Target index (default: settings.PINECONE_INDEX_NAME), e.g. a staging index
+    :param batch_size: Maximum vectors per upsert request
+    :param max_workers: Concurrent upsert requests
+    :param verify: Check chunk checksums before upserting
+    :return: dict with "upserted" and "failed" vector counts and up to 5 "errors" messages
+    """
+    manifest = read_manifest(path)
+    if namespace is None:
+        namespace = manifest["namespace"]
+    index = get_index(index_name)
+
+    dimension, _ = _namespace_stats(index, namespace)
+    if manifest["dimension"] is not None and dimension != manifest["dimension"]:
+        raise ValueError(
+            f"Dimension mismatch: snapshot has {manifest['dimension']}, target index has {dimension}"
+        )
+
+    result = {"upserted": 0, "failed": 0, "errors": []}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for ids, vectors, metadata in iter_snapshot(path, verify=verify):
+            records = [(vec_id, vec.tolist(), meta) for vec_id, vec, meta in zip(ids, vectors, metadata)]
+            futures = [
+                (len(batch), pool.submit(index.upsert, vectors=batch, namespace=namespace))
+                for batch in _size_batches(records, batch_size, MAX_UPSERT_BYTES)
+            ]
+            for count, future in futures:
+                try:
+                    future.result()
+                    result["upserted"] += count
+                except Exception as e:
+                    result["failed"] += count
+                    if len(result["errors"]) < 5:
+                        result["errors"].append(str(e))
+
+    return result
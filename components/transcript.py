@@ -0,0 +1,97 @@
+# transcript.py
+
+import os
+import json
+import uuid
+from datetime import datetime
+
+TRANSCRIPT_DIR = os.path.join("data", "transcripts")
+
+
+def new_session_id():
+    """
+    Generates a sortable session ID (timestamp prefix + short random suffix).
+
+    :return: Session ID string
+    """
+    return f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+def _transcript_path(session_id):
+    return os.path.join(TRANSCRIPT_DIR, f"{session_id}.jsonl")
+
+
+def append_message(session_id, role, content):
+    """
+    Appends a single message to the session's transcript file (one JSON object per line).
+    If a previous write was interrupted mid-line, the partial line is terminated first so it
+    doesn't swallow this message.
+
+    :param session_id: Session the message belongs to
+    :param role: Message role ("user" / "assistant")
+    :param content: Message text
+    :return: The stored message dictionary
+    """
+    msg = {"role": role, "content": content, "timestamp": datetime.now().isoformat()}
+    os.makedirs(TRANSCRIPT_DIR, exist_ok=True)
+    path = _transcript_path(session_id)
+
+    needs_newline = False
+    if os.path.exists(path) and os.path.getsize(path) > 0:
+        with open(path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            needs_newline = f.read(1) != b"\n"
+
+    with open(path, "a", encoding="utf-8") as f:
+        if needs_newline:
+            f.write("\n")
+        f.write(json.dumps(msg, ensure_ascii=False) + "\n")
+    return msg
+
+
+def load_transcript(session_id):
+    """
+    Reads a session's transcript back into a list of message dictionaries.
+    Truncated or corrupt lines (e.g. from an interrupted write) are skipped.
+
+    :param session_id: Session to restore
+    :return: List of messages in chronological order
+    """
+    path = _transcript_path(session_id)
+    if not os.path.exists(path):
+        return []
+
+    messages = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                messages.append(json.loads(line))
+            except ValueError:
+                continue
+    return messages
+
+
+def list_sessions(limit=None):
+    """
+    Lists stored sessions, most recent first.
+
+    :param limit: Maximum number of sessions to return (default: all)
+    :return: List of session ID strings
+    """
+    if not os.path.isdir(TRANSCRIPT_DIR):
+        return []
+
+    sessions = [name[:-len(".jsonl")] for name in os.listdir(TRANSCRIPT_DIR) if name.endswith(".jsonl")]
+    return sorted(sessions, reverse=True)[:limit]
+
+
+def message_window(messages, visible_count):
+    """
+    Splits messages into the hidden older turns and the visible recent window.
+
+    :param messages: Full message list
+    :param visible_count: Number of most recent messages to render
+    :return: tuple (hidden_count, visible_messages)
+    """
+    hidden = max(len(messages) - visible_count, 0)
+    return hidden, messages[hidden:]
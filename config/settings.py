@@ -8,6 +8,7 @@ class Settings:
         self.PINECONE_API_KEY = os.getenv("PINECONE_API_KEY")
         self.PINECONE_ENV = os.getenv("PINECONE_ENV")
         self.PINECONE_INDEX_NAME = "dt-knowledge"
+        self.DT_ADMIN_PASSWORD = os.getenv("DT_ADMIN_PASSWORD")  # gates restoring saved chat sessions
 
 # Instantiate and expose
 settings = Settings()
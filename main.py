@@ -7,19 +7,34 @@ st.write("✅ DT App Initialising...")
 
 # === IMPORTS WITH SAFETY CHECK ===
 try:
-    from components.interface import render_sidebar, handle_file_uploads
+    from components.interface import render_sidebar, handle_file_uploads, render_session_picker
     from components.chat_handler import build_system_prompt, get_chat_response
     from components.memory import get_vectorstore, store_to_memory
+    from components.transcript import new_session_id, append_message, message_window
     st.success("✅ All components imported successfully.")
 except Exception as e:
     st.error(f"❌ Import error: {e}")
     st.stop()
 
 # === SESSION STATE INITIALISATION ===
+HISTORY_PAGE_SIZE = 20  # messages rendered per page of chat history
+MODEL_CONTEXT_MESSAGES = 12  # most recent messages sent to the model (keeps gpt-4 within its context)
 if "messages" not in st.session_state:
     st.session_state.messages = []
 if "kryten_mode" not in st.session_state:
     st.session_state.kryten_mode = False
+if "session_id" not in st.session_state:
+    st.session_state.session_id = new_session_id()
+if "visible_count" not in st.session_state:
+    st.session_state.visible_count = HISTORY_PAGE_SIZE
+
+
+def persist_message(role, content):
+    try:
+        append_message(st.session_state.session_id, role, content)
+    except Exception as e:
+        st.warning(f"⚠️ Transcript write failed: {e}")
+
 
 # === UI HEADER ===
 st.title("🧠 Darren's Digital Twin")
@@ -39,6 +54,13 @@ else:
     last_uploaded_context = ""
     recent_summaries = []
 
+# === SIDEBAR SESSION RESTORE ===
+restored = render_session_picker(st.session_state.session_id)
+if restored:
+    st.session_state.session_id, st.session_state.messages = restored
+    st.session_state.visible_count = HISTORY_PAGE_SIZE
+    st.rerun()
+
 # === PROMPT & RESPONSE HANDLING ===
 prompt = st.chat_input("Ask the Digital Twin something...")
 if prompt:
@@ -49,6 +71,7 @@ if prompt:
 
     st.chat_message("user").markdown(prompt)
     st.session_state.messages.append({"role": "user", "content": prompt})
+    persist_message("user", prompt)
 
     # === MEMORY RETRIEVAL (dt-memory namespace) ===
     try:
@@ -74,26 +97,41 @@ if prompt:
 
     # === MODEL RESPONSE GENERATION ===
     try:
-        full_convo = [{"role": m["role"], "content": m["content"]} for m in st.session_state.messages]
+        _, recent_messages = message_window(st.session_state.messages, MODEL_CONTEXT_MESSAGES)
+        recent_convo = [{"role": m["role"], "content": m["content"]} for m in recent_messages]
         reply, model = get_chat_response(
-            messages=[{"role": "system", "content": system_prompt}] + full_convo
+            messages=[{"role": "system", "content": system_prompt}] + recent_convo
         )
         # st.chat_message("assistant").markdown(reply)
         st.markdown(f"*Model used: `{model}`*")
-        st.session_state.messages.append({"role": "assistant", "content": reply})
+        if model == "Unavailable":
+            # get_chat_response returns the error text as the reply; don't keep it
+            st.warning(reply)
+            reply = None
+        else:
+            st.session_state.messages.append({"role": "assistant", "content": reply})
+            persist_message("assistant", reply)
     except Exception as e:
+        reply = None
         st.warning(f"⚠️ OpenAI response failed: {e}")
 
     # === STORE TO MEMORY ===
-    try:
-        memory_store = get_vectorstore("dt-knowledge", namespace="dt-memory")
-        store_to_memory(memory_store, reply)
-        st.markdown("✅ Memory updated.")
-    except Exception as e:
-        st.warning(f"⚠️ Memory write failed: {e}")
+    if reply:
+        try:
+            memory_store = get_vectorstore("dt-knowledge", namespace="dt-memory")
+            store_to_memory(memory_store, reply)
+            st.markdown("✅ Memory updated.")
+        except Exception as e:
+            st.warning(f"⚠️ Memory write failed: {e}")
+
+# === DISPLAY CHAT HISTORY (windowed) ===
+hidden_count, visible_messages = message_window(st.session_state.messages, st.session_state.visible_count)
+if hidden_count:
+    if st.button(f"⬆️ Load earlier messages ({hidden_count} hidden)"):
+        st.session_state.visible_count += HISTORY_PAGE_SIZE
+        st.rerun()
 
-# === DISPLAY CHAT HISTORY ===
-for msg in st.session_state.messages:
+for msg in visible_messages:
     with st.chat_message(msg["role"]):
         st.markdown(msg["content"])
 
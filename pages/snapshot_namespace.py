@@ -0,0 +1,72 @@
+# snapshot_namespace.py – DT Namespace Snapshot Export / Import
+
+import streamlit as st
+import io
+from datetime import datetime
+from components.snapshot import export_namespace, import_snapshot, read_manifest, list_namespaces
+
+# === PAGE CONFIG ===
+st.set_page_config(page_title="💾 DT Namespace Snapshots", page_icon="💾")
+st.title("💾 Namespace Snapshot Export / Import")
+st.markdown("Back up, restore or clone DT memory without re-embedding source files.")
+
+# === EXPORT ===
+st.subheader("⬇️ Export")
+try:
+    ns_options = list_namespaces()
+except Exception as e:
+    ns_options = []
+    st.error(f"❌ Failed to list namespaces: {e}")
+export_ns = st.selectbox(
+    "Namespace to export:", ns_options, key="export_ns", format_func=lambda ns: ns or "(default)"
+)
+quantise_label = st.selectbox("Vector precision:", ["float32 (exact)", "float16", "int8 (smallest)"])
+quantise = {"float32 (exact)": None, "float16": "float16", "int8 (smallest)": "int8"}[quantise_label]
+
+if ns_options and st.button("▶️ Create Snapshot"):
+    namespace = export_ns
+    file_name = f"{export_ns or 'default-namespace'}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.dtsnap"
+    try:
+        buffer = io.BytesIO()
+        with st.spinner("Streaming vectors from Pinecone..."):
+            manifest = export_namespace(buffer, namespace, quantise=quantise)
+        st.success(f"✅ Exported {manifest['count']} vectors in {len(manifest['chunks'])} chunk(s).")
+        st.download_button("💾 Download snapshot", buffer.getvalue(), file_name=file_name)
+    except Exception as e:
+        st.error(f"❌ Export failed: {e}")
+
+# === IMPORT ===
+st.markdown("---")
+st.subheader("⬆️ Import")
+snapshot_file = st.file_uploader("Upload a snapshot file", type=["dtsnap"])
+
+if snapshot_file:
+    try:
+        manifest = read_manifest(snapshot_file)
+        st.write(
+            f"📦 `{manifest['namespace'] or '(default)'}` from `{manifest['index']}` – "
+            f"{manifest['count']} vectors, dimension {manifest['dimension']}, "
+            f"precision {manifest['quantise'] or 'float32'}, taken {manifest['created_at']}"
+        )
+        target_index = st.text_input("Target index:", value=manifest["index"])
+        target_ns = st.text_input("Target namespace:", value=manifest["namespace"])
+
+        if st.button("▶️ Restore Snapshot"):
+            snapshot_file.seek(0)
+            with st.spinner("Upserting vectors..."):
+                result = import_snapshot(snapshot_file, namespace=target_ns, index_name=target_index)
+            if result["failed"]:
+                st.error(
+                    f"❌ Partial restore into `{target_ns or '(default)'}`: {result['upserted']} vectors upserted, "
+                    f"{result['failed']} failed."
+                )
+                for error in result["errors"]:
+                    st.code(error)
+            else:
+                st.success(f"✅ Restored {result['upserted']} vectors into `{target_ns or '(default)'}`.")
+    except Exception as e:
+        st.error(f"❌ Import failed: {e}")
+
+# === FOOTER ===
+st.markdown("---")
+st.caption("v1.0 – DT Namespace Snapshots – Darren Eastland")